@@ -0,0 +1,50 @@
+-- Migration: Per-field coverage for the nightly audit (A08-A13, A17, A18)
+-- One filtered scan of movies instead of eight count=exact REST queries.
+-- Returns one row per field with the non-null count, table total and
+-- coverage percentage, so the audit reads the percentages straight off a
+-- single response.
+-- Run this in Supabase SQL Editor
+
+-- ============================================
+-- FUNCTION: Coverage per audited movies column
+-- ============================================
+CREATE OR REPLACE FUNCTION audit_field_coverage()
+RETURNS TABLE (
+    field TEXT,
+    non_null_count BIGINT,
+    total BIGINT,
+    coverage_pct NUMERIC
+) AS $$
+    SELECT
+        v.field,
+        v.non_null_count,
+        c.total,
+        COALESCE(100.0 * v.non_null_count / NULLIF(c.total, 0), 0)
+    FROM (
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE poster_path IS NOT NULL) AS poster_path,
+            COUNT(*) FILTER (WHERE overview IS NOT NULL) AS overview,
+            COUNT(*) FILTER (WHERE genres IS NOT NULL) AS genres,
+            COUNT(*) FILTER (WHERE release_date IS NOT NULL) AS release_date,
+            COUNT(*) FILTER (WHERE runtime IS NOT NULL) AS runtime,
+            COUNT(*) FILTER (WHERE vote_average IS NOT NULL) AS vote_average,
+            COUNT(*) FILTER (WHERE ott_providers IS NOT NULL) AS ott_providers,
+            COUNT(*) FILTER (WHERE ratings_enriched_at IS NOT NULL) AS ratings_enriched_at
+        FROM movies
+    ) c
+    CROSS JOIN LATERAL (VALUES
+        ('poster_path', c.poster_path),
+        ('overview', c.overview),
+        ('genres', c.genres),
+        ('release_date', c.release_date),
+        ('runtime', c.runtime),
+        ('vote_average', c.vote_average),
+        ('ott_providers', c.ott_providers),
+        ('ratings_enriched_at', c.ratings_enriched_at)
+    ) AS v(field, non_null_count);
+$$ LANGUAGE sql STABLE;
+
+-- Audit-only: callable with the service role key, not from the app
+REVOKE EXECUTE ON FUNCTION audit_field_coverage() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION audit_field_coverage() TO service_role;
@@ -0,0 +1,41 @@
+-- Migration: Score the audit's profile spot-checks server-side (A20-A23)
+-- One call looks up every spot-check title and compares its dimension
+-- against the threshold, instead of one REST query per group.
+-- Run this in Supabase SQL Editor
+
+-- ============================================
+-- FUNCTION: Spot-check emotional_profile dimensions for named titles
+-- p_checks: [{"check_id": "A20", "dimension": "darkness", "threshold": 6, "titles": [...]}]
+-- Returns one row per title found (first matching movie with a readable
+-- profile), with the raw dimension value and whether it meets the
+-- threshold (missing = 0). Profiles stored as a JSON string are unwrapped
+-- first; NULL and non-object profiles are skipped, as the audit's REST
+-- fallback does, so both paths score the same titles.
+-- ============================================
+CREATE OR REPLACE FUNCTION audit_spot_checks(p_checks JSONB)
+RETURNS TABLE (
+    check_id TEXT,
+    title TEXT,
+    value JSONB,
+    passed BOOLEAN
+) AS $$
+    SELECT DISTINCT ON (c.check_id, m.title)
+        c.check_id,
+        m.title,
+        p.profile -> c.dimension,
+        COALESCE((p.profile ->> c.dimension)::NUMERIC, 0) >= c.threshold
+    FROM jsonb_to_recordset(p_checks) AS c(check_id TEXT, dimension TEXT, threshold NUMERIC, titles TEXT[])
+    JOIN movies m ON m.title = ANY(c.titles)
+    CROSS JOIN LATERAL (
+        SELECT CASE jsonb_typeof(m.emotional_profile::JSONB)
+                   WHEN 'string' THEN (m.emotional_profile::JSONB #>> '{}')::JSONB
+                   ELSE m.emotional_profile::JSONB
+               END AS profile
+    ) p
+    WHERE jsonb_typeof(p.profile) = 'object'
+    ORDER BY c.check_id, m.title;
+$$ LANGUAGE sql STABLE;
+
+-- Audit-only: callable with the service role key, not from the app
+REVOKE EXECUTE ON FUNCTION audit_spot_checks(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION audit_spot_checks(JSONB) TO service_role;
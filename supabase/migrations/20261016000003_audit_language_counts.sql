@@ -0,0 +1,21 @@
+-- Migration: Language distribution for the nightly audit (A19)
+-- One grouped scan instead of one count=exact REST query per language.
+-- Run this in Supabase SQL Editor
+
+-- ============================================
+-- FUNCTION: Movie counts for the given original_language codes
+-- ============================================
+CREATE OR REPLACE FUNCTION audit_language_counts(p_languages TEXT[])
+RETURNS TABLE (
+    lang TEXT,
+    movie_count BIGINT
+) AS $$
+    SELECT original_language, COUNT(*)
+    FROM movies
+    WHERE original_language = ANY(p_languages)
+    GROUP BY original_language;
+$$ LANGUAGE sql STABLE;
+
+-- Audit-only: callable with the service role key, not from the app
+REVOKE EXECUTE ON FUNCTION audit_language_counts(TEXT[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION audit_language_counts(TEXT[]) TO service_role;
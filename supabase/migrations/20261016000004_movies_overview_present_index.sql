@@ -0,0 +1,6 @@
+-- Migration: Partial index for movies with a non-empty overview (I25)
+-- The audit counts overview=neq. rows; with this index Postgres can answer
+-- the count from the index alone instead of reading every movies row.
+-- Run this in Supabase SQL Editor
+
+CREATE INDEX IF NOT EXISTS idx_movies_overview_present ON movies (id) WHERE overview <> '';
@@ -0,0 +1,24 @@
+-- Migration: Duplicate tmdb_id detection for the nightly audit (A14)
+-- One grouped scan over the whole table instead of diffing a 500-row
+-- REST sample client-side.
+-- Run this in Supabase SQL Editor
+
+-- ============================================
+-- FUNCTION: Every tmdb_id held by more than one movie, with its row count
+-- ============================================
+CREATE OR REPLACE FUNCTION audit_duplicate_tmdb_ids()
+RETURNS TABLE (
+    tmdb_id BIGINT,
+    copies BIGINT
+) AS $$
+    SELECT m.tmdb_id::BIGINT, COUNT(*)
+    FROM movies m
+    WHERE m.tmdb_id IS NOT NULL
+    GROUP BY m.tmdb_id
+    HAVING COUNT(*) > 1
+    ORDER BY COUNT(*) DESC, m.tmdb_id;
+$$ LANGUAGE sql STABLE;
+
+-- Audit-only: callable with the service role key, not from the app
+REVOKE EXECUTE ON FUNCTION audit_duplicate_tmdb_ids() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION audit_duplicate_tmdb_ids() TO service_role;